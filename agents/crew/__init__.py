@@ -1,2 +1,3 @@
 from .ollama_agent import OllamaAgent
 from .script_crew import ScriptCrew
+from .script_pipeline import ScriptPipeline
@@ -2,15 +2,14 @@
 from crewai import Agent
 import requests
 import json
-from dotenv import load_dotenv
 from .ollama_llm import OllamaLLM
-from utils.logger import setup_logger
+from utils.env import load_env
+from utils.logger import setup_logger, log_payload, sample_payload
 from datetime import datetime
 import time
 from tenacity import retry, stop_after_attempt, wait_exponential
 from pydantic import Field
-from typing import Dict
-load_dotenv()
+from typing import AsyncIterator, Dict
 logger = setup_logger("Ollama Agents")
 
 class OllamaAgent(Agent):
@@ -18,7 +17,7 @@ class OllamaAgent(Agent):
     performance_metrics: Dict = Field(default={})
 
     def __init__(self, *args, **kwargs):
-        load_dotenv()
+        load_env()
         ollama_llm = OllamaLLM()
         performance_metrics = {
             "api_calls": 0,
@@ -40,7 +39,8 @@ class OllamaAgent(Agent):
         """Make a call to Ollama API with retry logic"""
         start_time = time.time()
         self.performance_metrics["api_calls"] += 1
-        logger.debug(f"Ollama API call triggered with promt {prompt}")
+        sampled = sample_payload()
+        log_payload(logger, "Ollama API call triggered with prompt", prompt, sampled=sampled)
         try:
             response = requests.post(
                 f"{self.llm.openai_api_base}/api/generate",
@@ -58,8 +58,8 @@ class OllamaAgent(Agent):
             response_time = time.time() - start_time
             self.performance_metrics["response_times"].append(response_time)
             self.performance_metrics["total_tokens"] += len(result.split())
-            logger.debug(f"Ollama API call completed in {response_time:.2f}s")
-            logger.debug(f"Ollama API call completed and output is {result}")
+            logger.debug("Ollama API call completed in %.2fs", response_time)
+            log_payload(logger, "Ollama API call completed and output is", result, sampled=sampled)
             return result
             
         except requests.exceptions.Timeout:
@@ -67,19 +67,16 @@ class OllamaAgent(Agent):
             self.performance_metrics["errors"] += 1
             raise
         except requests.exceptions.RequestException as e:
-            logger.error(f"Error calling Ollama: {str(e)}")
+            logger.error("Error calling Ollama: %s", e)
             self.performance_metrics["errors"] += 1
             raise
         except Exception as e:
-            logger.error(f"Unexpected error in Ollama call: {str(e)}")
+            logger.error("Unexpected error in Ollama call: %s", e)
             self.performance_metrics["errors"] += 1
             raise
             
-    def execute_task(self, task: str, context=None, tools=None) -> str:
-        """Override the execute_task method to use Ollama with performance tracking"""
-        start_time = time.time()
-        
-        # Create a prompt that includes the agent's role and the task
+    def build_prompt(self, task: str, context=None, tools=None) -> str:
+        """Create a prompt that includes the agent's role and the task"""
         task_description = task
 
         # If there are tools, append them to the task description
@@ -87,7 +84,7 @@ class OllamaAgent(Agent):
             tools_description = "\n\nAvailable tools:\n" + "\n".join([f"- {tool.name}: {tool.description}" for tool in tools])
             task_description = f"{task_description}{tools_description}"
 
-        prompt = f"""
+        return f"""
         Role: {self.role}
         Goal: {self.goal}
         Backstory: {self.backstory}
@@ -96,16 +93,82 @@ class OllamaAgent(Agent):
         
         Please provide your response in a clear and structured format.
         """
+
+    def execute_task(self, task: str, context=None, tools=None) -> str:
+        """Override the execute_task method to use Ollama with performance tracking"""
+        start_time = time.time()
+        prompt = self.build_prompt(task, context, tools)
         
         try:
             # Call Ollama and get the response
             response = self._call_ollama(prompt)
             execution_time = time.time() - start_time
-            logger.info(f"{self.role} executed the task in {execution_time:.2f}s")
+            logger.info("%s executed the task in %.2fs", self.role, execution_time)
             return response
             
         except Exception as e:
-            logger.error(f"Error executing task: {str(e)}", exc_info=True)
+            logger.error("Error executing task: %s", e, exc_info=True)
+            raise
+
+    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
+    async def _open_ollama_stream(self, session, prompt: str):
+        """Start a streaming Ollama request with retry logic, returning the open response"""
+        response = await session.post(
+            f"{self.llm.base_url}/api/generate",
+            json={
+                "model": self.llm.model_name,
+                "prompt": prompt,
+                "stream": True
+            }
+        )
+        try:
+            response.raise_for_status()
+        except Exception:
+            response.release()
+            raise
+        return response
+
+    async def stream_task(self, task: str, context=None) -> AsyncIterator[str]:
+        """Execute a task with Ollama's streaming API, yielding text chunks as they arrive"""
+        import aiohttp
+
+        start_time = time.time()
+        prompt = self.build_prompt(task, context)
+        self.performance_metrics["api_calls"] += 1
+        sampled = sample_payload()
+        log_payload(logger, "Ollama streaming call triggered with prompt", prompt, sampled=sampled)
+        output_tokens = 0
+        chunks = []
+        try:
+            timeout = aiohttp.ClientTimeout(total=None, sock_read=300)
+            async with aiohttp.ClientSession(timeout=timeout) as session:
+                # Only the request setup is retried; once chunks have been
+                # yielded a retry would duplicate output
+                response = await self._open_ollama_stream(session, prompt)
+                async with response:
+                    # Ollama streams one JSON object per line
+                    async for line in response.content:
+                        if not line.strip():
+                            continue
+                        data = json.loads(line)
+                        chunk = data.get("response", "")
+                        if chunk:
+                            output_tokens += len(chunk.split())
+                            if sampled:
+                                chunks.append(chunk)
+                            yield chunk
+                        if data.get("done"):
+                            break
+
+            response_time = time.time() - start_time
+            self.performance_metrics["response_times"].append(response_time)
+            self.performance_metrics["total_tokens"] += output_tokens
+            logger.info("%s streamed the task in %.2fs", self.role, response_time)
+            log_payload(logger, "Ollama streaming call completed and output is", "".join(chunks), sampled=sampled)
+
+        except Exception as e:
+            logger.error("Error streaming from Ollama: %s", e)
+            self.performance_metrics["errors"] += 1
             raise
 
     def get_performance_metrics(self):
@@ -3,10 +3,10 @@ from langchain.llms.base import LLM
 from typing import Any, List, Optional, Dict
 import requests
 import os
-from dotenv import load_dotenv
 from langchain.callbacks.manager import CallbackManagerForLLMRun
 
 from pydantic import Field
+from utils.env import load_env
 
 class OllamaLLM(LLM):
 
@@ -16,7 +16,7 @@ class OllamaLLM(LLM):
 
     def __init__(self, **kwargs):
         # Load environment variables
-        load_dotenv()
+        load_env()
 
         # Set default values from environment variables
         kwargs.setdefault('base_url', os.getenv("OLLAMA_BASE_URL", "http://localhost:11434"))
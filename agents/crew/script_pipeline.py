@@ -0,0 +1,224 @@
+# agents/crew/script_pipeline.py
+import asyncio
+import json
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from utils.json_stream import IncrementalJSONParser, JSONStreamEvent
+
+# Research fields the structure stage needs before it can start
+RESEARCH_READY_KEYS = ("key_facts", "potential_hooks")
+
+# Sentinel closing a stage queue
+_DONE = object()
+
+# Ordering of written sections: hook, then main_sections, then conclusion
+_HOOK, _MAIN, _CONCLUSION = 0, 1, 2
+
+
+class PipelineParseError(ValueError):
+    """A stage produced no JSON the next stage can be scheduled from"""
+
+
+class StageOutput:
+    """Full text and parser of one streamed agent call, filled in as it streams"""
+
+    def __init__(self):
+        self.chunks: List[str] = []
+        self.parser = IncrementalJSONParser()
+
+    @property
+    def text(self) -> str:
+        return "".join(self.chunks)
+
+
+class ScriptPipeline:
+    """
+    Run research, structure and writing as overlapping streaming stages.
+
+    Each stage streams its JSON output through an IncrementalJSONParser and
+    forwards completed fields through bounded asyncio queues. Structure
+    starts once RESEARCH_READY_KEYS have arrived. The hook, each
+    ``main_sections`` entry and the conclusion are written as soon as the
+    storyteller emits them; transitions are attached to the main sections
+    once the structure is complete.
+    """
+
+    def __init__(self, crew, queue_size: int = 8, max_parallel_sections: int = 2):
+        self.crew = crew
+        self.logger = crew.logger
+        self.queue_size = queue_size
+        self.max_parallel_sections = max_parallel_sections
+
+    async def run(self, topic: str) -> Dict[str, Any]:
+        """Generate a script for the topic and return research, structure and sections"""
+        research_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        section_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        research: Dict[str, Any] = {}
+        structure: Dict[str, Any] = {}
+        research_output = StageOutput()
+
+        tasks = [
+            asyncio.create_task(self._research_stage(topic, research_queue, research_output)),
+            asyncio.create_task(self._structure_stage(topic, research_queue, research, research_output,
+                                                      section_queue, structure)),
+            asyncio.create_task(self._writing_stage(topic, section_queue)),
+        ]
+        try:
+            _, _, written = await asyncio.gather(*tasks)
+        except BaseException:
+            await self._cancel(*tasks)
+            raise
+
+        # transitions[i] leads from main section i to main section i + 1
+        transitions = structure.get("transitions") or []
+        sections = []
+        for (part, index), section in written:
+            if part == _MAIN and index < len(transitions) and isinstance(section, dict):
+                section = {**section, "transition": transitions[index]}
+            sections.append(section)
+
+        return {
+            "research": research,
+            "structure": structure,
+            "sections": sections,
+        }
+
+    @staticmethod
+    async def _cancel(*tasks: Optional[asyncio.Task]):
+        """Cancel tasks and wait for them so their cleanup runs on this loop"""
+        tasks = [task for task in tasks if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _stream_stage(self, stage: str, agent, description: str, context: Optional[str],
+                            output: StageOutput) -> AsyncIterator[JSONStreamEvent]:
+        """Stream one agent call, yielding parsed events as they complete
+
+        Callers must aclose() the generator so the HTTP stream
+        is released on this loop when they stop early.
+        """
+        chunks = agent.stream_task(description, context=context)
+        try:
+            async for chunk in chunks:
+                output.chunks.append(chunk)
+                for event in output.parser.feed(chunk):
+                    yield event
+        finally:
+            await chunks.aclose()
+
+        self.crew._track_task_completion(stage, SimpleNamespace(output=output.text, agent=agent))
+
+    async def _research_stage(self, topic: str, research_queue: asyncio.Queue, output: StageOutput):
+        description = self.crew.tasks_config.get("research", {}).get("description", "").format(topic=topic)
+        events = self._stream_stage("research", self.crew.researcher, description, None, output)
+        try:
+            async for event in events:
+                await research_queue.put(event)
+        finally:
+            await events.aclose()
+        await research_queue.put(_DONE)
+
+    async def _structure_stage(self, topic: str, research_queue: asyncio.Queue, research: Dict[str, Any],
+                               research_output: StageOutput, section_queue: asyncio.Queue,
+                               structure: Dict[str, Any]):
+        # Wait only until the research fields the storyteller needs are complete
+        research_done = False
+        while not all(key in research for key in RESEARCH_READY_KEYS):
+            event = await research_queue.get()
+            if event is _DONE:
+                research_done = True
+                break
+            if event.index is None:
+                research[event.key] = event.value
+
+        if research_done:
+            # Research finished without the fields we wait for, usually because
+            # the model did not emit valid JSON; pass its text on like the
+            # sequential crew does
+            self.logger.warning("Research output has no %s, passing the raw text to the structure stage",
+                                " and ".join(RESEARCH_READY_KEYS))
+            context = research_output.text
+        else:
+            self.logger.info("Starting structure stage with research fields: %s", ", ".join(research))
+            context = json.dumps(research)
+        drain = None if research_done else asyncio.create_task(self._drain_research(research_queue, research))
+
+        config = self.crew.tasks_config.get("structure", {})
+        description = config.get("description", "").format(topic=topic, context=context)
+
+        events = self._stream_stage("structure", self.crew.storyteller, description, context, StageOutput())
+        scheduled = 0
+        try:
+            async for event in events:
+                item = None
+                if event.index is None:
+                    structure[event.key] = event.value
+                    if event.key == "hook" and event.value:
+                        item = ((_HOOK, 0), {"title": "Introduction", "hook": event.value})
+                    elif event.key == "conclusion" and event.value:
+                        item = ((_CONCLUSION, 0), {"title": "Conclusion", "conclusion": event.value})
+                elif event.key == "main_sections":
+                    item = ((_MAIN, event.index), event.value)
+                if item is not None:
+                    await section_queue.put(item)
+                    scheduled += 1
+            if not scheduled:
+                raise PipelineParseError("Structure output has no hook, main_sections or conclusion to write")
+        except BaseException:
+            await self._cancel(drain)
+            raise
+        finally:
+            await events.aclose()
+        await section_queue.put(_DONE)
+
+        if drain is not None:
+            await drain
+
+    async def _drain_research(self, research_queue: asyncio.Queue, research: Dict[str, Any]):
+        """Keep consuming late research fields so the research stream never blocks"""
+        while True:
+            event = await research_queue.get()
+            if event is _DONE:
+                return
+            if event.index is None:
+                research[event.key] = event.value
+
+    async def _writing_stage(self, topic: str, section_queue: asyncio.Queue) -> List[Tuple[Tuple[int, int], Any]]:
+        semaphore = asyncio.Semaphore(self.max_parallel_sections)
+        writers = []
+        try:
+            while True:
+                item = await section_queue.get()
+                if item is _DONE:
+                    break
+                order, section = item
+                writers.append(asyncio.create_task(self._write_section(topic, order, section, semaphore)))
+
+            written = await asyncio.gather(*writers)
+        except BaseException:
+            await self._cancel(*writers)
+            raise
+        return sorted(written, key=lambda item: item[0])
+
+    async def _write_section(self, topic: str, order: Tuple[int, int], section: Any,
+                             semaphore: asyncio.Semaphore) -> Tuple[Tuple[int, int], Dict[str, Any]]:
+        part, index = order
+        stage = {_HOOK: "writing_hook", _CONCLUSION: "writing_conclusion"}.get(part, f"writing_section_{index}")
+        async with semaphore:
+            description = self.crew.tasks_config.get("write_section", {}).get("description", "").format(
+                topic=topic, section=json.dumps(section)
+            )
+            output = StageOutput()
+            events = self._stream_stage(stage, self.crew.writer, description, None, output)
+            try:
+                async for _ in events:
+                    pass
+            finally:
+                await events.aclose()
+
+        if output.parser.done and output.parser.result:
+            return order, output.parser.result
+        title = section.get("title", "") if isinstance(section, dict) else str(section)
+        return order, {"title": title, "content": output.text}
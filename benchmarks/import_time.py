@@ -0,0 +1,71 @@
+# benchmarks/import_time.py
+"""
+Measure cold import cost of the app's modules with ``python -X importtime``.
+
+Usage:
+    python -m benchmarks.import_time [module ...] [--top N]
+"""
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+DEFAULT_MODULES = [
+    "utils.logger",
+    "utils.config_loader",
+    "config.schema",
+    "services",
+    "services.script_service",
+    "agents.crew.script_crew",
+]
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure_import(module: str) -> Tuple[int, List[Tuple[int, int, str]]]:
+    """Import a module in a fresh interpreter and return its cumulative time and the raw rows (microseconds)"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=project_root,
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append((int(self_us), int(cumulative_us), name.strip()))
+
+    total = next((cumulative for _, cumulative, name in rows if name == module), 0)
+    return total, rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--top", type=int, default=5, help="Heaviest dependencies to show per module")
+    args = parser.parse_args()
+
+    results: Dict[str, int] = {}
+    for module in args.modules:
+        try:
+            total, rows = measure_import(module)
+        except RuntimeError as e:
+            print(f"{module:<32} failed: {e}")
+            continue
+        results[module] = total
+        print(f"{module:<32} {total / 1000:>9.1f} ms")
+        heaviest = sorted((row for row in rows if row[2] != module), key=lambda row: row[1], reverse=True)
+        for _, cumulative, name in heaviest[:args.top]:
+            print(f"    {name:<28} {cumulative / 1000:>9.1f} ms")
+
+    return 0 if results else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,26 @@
-from .script_service import (ScriptGenerationService)
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .script_service import ScriptGenerationService
+    from .video_service import VideoRenderingService
+    from .session_store import SessionStore
 
 __all__ = [
     'ScriptGenerationService',
-]
\ No newline at end of file
+    'VideoRenderingService',
+    'SessionStore',
+]
+
+
+def __getattr__(name):
+    # Resolve services lazily so importing the package stays cheap
+    if name == 'ScriptGenerationService':
+        from .script_service import ScriptGenerationService
+        return ScriptGenerationService
+    if name == 'VideoRenderingService':
+        from .video_service import VideoRenderingService
+        return VideoRenderingService
+    if name == 'SessionStore':
+        from .session_store import SessionStore
+        return SessionStore
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,12 +4,11 @@ from typing import Dict, Any, Optional
 import json
 import os
 from datetime import datetime
-from agents.crew.script_crew import ScriptCrew
 from utils.logger import setup_logger
 
 class ScriptGenerationService:
     def __init__(self):
-        self.script_crew = ScriptCrew()
+        self._script_crew = None
         self.logger = setup_logger("ScriptService")
         self.performance_metrics = {
             "total_requests": 0,
@@ -18,9 +17,23 @@ class ScriptGenerationService:
             "average_generation_time": 0,
             "total_generation_time": 0
         }
+
+    @property
+    def script_crew(self):
+        """Build the crew on first use so the agent stack is imported lazily"""
+        if self._script_crew is None:
+            from agents.crew.script_crew import ScriptCrew
+            self._script_crew = ScriptCrew()
+        return self._script_crew
         
-    async def generate_script(self, topic: str) -> Dict[str, Any]:
-        """Generate a script using the crew of agents"""
+    async def generate_script(self, topic: str, pipelined: Optional[bool] = None) -> Dict[str, Any]:
+        """Generate a script using the crew of agents
+
+        With ``pipelined`` (default: SCRIPT_PIPELINE env var) the stages
+        stream and overlap instead of running one after another.
+        """
+        if pipelined is None:
+            pipelined = os.getenv("SCRIPT_PIPELINE", "false").lower() in ("1", "true", "yes")
         start_time = datetime.now()
         self.performance_metrics["total_requests"] += 1
         
@@ -29,10 +42,13 @@ class ScriptGenerationService:
             if not topic or not isinstance(topic, str):
                 raise ValueError("Topic must be a non-empty string")
                 
-            self.logger.info(f"Starting script generation for topic: {topic}")
+            self.logger.info("Starting script generation for topic: %s", topic)
             
             # Generate the script
-            script = await self.script_crew.generate_script(topic)
+            if pipelined:
+                script = await self.script_crew.generate_script_pipelined(topic)
+            else:
+                script = await self.script_crew.generate_script(topic)
             
             # Validate script output
             # if not self._validate_script(script):
@@ -50,12 +66,12 @@ class ScriptGenerationService:
                 self.performance_metrics["successful_requests"]
             )
             
-            self.logger.info(f"Script generated successfully in {generation_time:.2f} seconds")
+            self.logger.info("Script generated successfully in %.2f seconds", generation_time)
             return script
             
         except Exception as e:
             self.performance_metrics["failed_requests"] += 1
-            self.logger.error(f"Error generating script: {str(e)}", exc_info=True)
+            self.logger.error("Error generating script: %s", e, exc_info=True)
             raise
         
     def _validate_script(self, script: Dict[str, Any]) -> bool:
@@ -74,7 +90,7 @@ class ScriptGenerationService:
                     
             return True
         except Exception as e:
-            self.logger.error(f"Error validating script: {str(e)}")
+            self.logger.error("Error validating script: %s", e)
             return False
         
     def _save_training_data(self, topic: str, script: Dict[str, Any]):
@@ -99,10 +115,10 @@ class ScriptGenerationService:
             with open(filename, "w") as f:
                 json.dump(data, f, indent=2)
                 
-            self.logger.info(f"Training data saved to {filename}")
+            self.logger.info("Training data saved to %s", filename)
             
         except Exception as e:
-            self.logger.error(f"Error saving training data: {str(e)}", exc_info=True)
+            self.logger.error("Error saving training data: %s", e, exc_info=True)
             
     def get_performance_metrics(self) -> Dict[str, Any]:
         """Get the service's performance metrics"""
@@ -0,0 +1,188 @@
+# services/session_store.py
+
+from typing import Dict, Any, List, Optional
+from collections import OrderedDict, deque
+import json
+import os
+import shutil
+import time
+import uuid
+import zlib
+from pathlib import Path
+from config.schema import VideoConfig
+from utils.logger import setup_logger
+
+class SessionStore:
+    """
+    Bounded per-session storage for generated scripts and search history.
+
+    Scripts are kept zlib-compressed in an LRU of at most ``max_scripts``
+    entries; evicted entries spill to disk and are loaded back lazily on
+    access. Only the newest ``max_history`` history entries stay in memory,
+    older ones are read from the session's history file when paged to.
+
+    Streamlit gives no hook for a session ending, so each new store sweeps
+    spill directories of sessions idle for longer than ``ttl_hours``.
+    """
+
+    def __init__(self, session_id: Optional[str] = None, max_scripts: Optional[int] = None,
+                 max_history: Optional[int] = None, spill_dir: Optional[str] = None,
+                 ttl_hours: Optional[float] = None):
+        self.session_id = session_id or str(uuid.uuid4())
+        self.max_scripts = max_scripts or int(os.getenv("SESSION_MAX_SCRIPTS", "5"))
+        self.max_history = max_history or int(os.getenv("SESSION_MAX_HISTORY", "50"))
+        self.ttl_hours = ttl_hours or float(os.getenv("SESSION_TTL_HOURS", "24"))
+        self.spill_root = Path(spill_dir or os.getenv("SESSION_SPILL_DIR", "data/sessions"))
+        self.spill_dir = self.spill_root / self.session_id
+        self.logger = setup_logger("SessionStore")
+        self._scripts: "OrderedDict[str, bytes]" = OrderedDict()
+        self._spilled = set()
+        self._history = deque(maxlen=self.max_history)
+        self._history_count = 0
+        self._sweep_expired()
+
+    def _sweep_expired(self):
+        """Delete spill directories of sessions idle for longer than the TTL"""
+        if not self.spill_root.is_dir():
+            return
+        cutoff = time.time() - self.ttl_hours * 3600
+        for session_dir in self.spill_root.iterdir():
+            if not session_dir.is_dir() or session_dir == self.spill_dir:
+                continue
+            try:
+                # The history file and scripts directory change on every write
+                last_used = max(
+                    path.stat().st_mtime
+                    for path in (session_dir, session_dir / "history.jsonl", session_dir / "scripts")
+                    if path.exists()
+                )
+            except OSError:
+                continue
+            if last_used < cutoff:
+                shutil.rmtree(session_dir, ignore_errors=True)
+                self.logger.debug("Removed expired session data %s", session_dir)
+
+    @staticmethod
+    def _pack(data: Dict[str, Any]) -> bytes:
+        return zlib.compress(json.dumps(data, separators=(",", ":"), default=str).encode("utf-8"))
+
+    @staticmethod
+    def _unpack(blob: bytes) -> Dict[str, Any]:
+        return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+    def _spill_path(self, search_id: str) -> Path:
+        return self.spill_dir / "scripts" / f"{search_id}.json.z"
+
+    def put_script(self, search_id: str, script: Any, config: VideoConfig):
+        """Store a generated script, spilling the least recently used one if over capacity"""
+        self._scripts[search_id] = self._pack({
+            "script": script,
+            "config": config.model_dump(mode="json"),
+        })
+        self._scripts.move_to_end(search_id)
+        self._spilled.discard(search_id)
+        self._evict()
+
+    def _evict(self):
+        """Spill least recently used scripts to disk until within capacity"""
+        while len(self._scripts) > self.max_scripts:
+            evicted_id, blob = self._scripts.popitem(last=False)
+            try:
+                path = self._spill_path(evicted_id)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(blob)
+                self._spilled.add(evicted_id)
+                self.logger.debug("Spilled script %s to %s", evicted_id, path)
+            except OSError as e:
+                self.logger.error("Error spilling script %s: %s", evicted_id, e)
+
+    def get_script(self, search_id: str) -> Optional[Dict[str, Any]]:
+        """Return the stored script and config, loading it from disk if it was spilled
+
+        Returns None if nothing is stored, including when the spilled file
+        has been removed (see _sweep_expired).
+        """
+        blob = self._scripts.get(search_id)
+        if blob is None:
+            if search_id not in self._spilled:
+                return None
+            try:
+                blob = self._spill_path(search_id).read_bytes()
+            except OSError as e:
+                # Forget the script so callers regenerate it instead of failing on every access
+                self._spilled.discard(search_id)
+                self.logger.error("Error loading spilled script %s: %s", search_id, e)
+                return None
+            self._promote(search_id, blob)
+        else:
+            self._scripts.move_to_end(search_id)
+
+        data = self._unpack(blob)
+        return {
+            "script": data["script"],
+            "config": VideoConfig(**data["config"]),
+        }
+
+    def _promote(self, search_id: str, blob: bytes):
+        """Move a spilled script back into the in-memory LRU"""
+        self._scripts[search_id] = blob
+        self._spilled.discard(search_id)
+        try:
+            self._spill_path(search_id).unlink()
+        except OSError:
+            pass
+        self._evict()
+
+    def has_script(self, search_id: str) -> bool:
+        """Whether a script is stored for the search, in memory or on disk"""
+        return search_id in self._scripts or search_id in self._spilled
+
+    def add_history(self, search_id: str, topic: str, timestamp: str):
+        """Record a search; every entry is appended to disk, only the newest stay in memory"""
+        entry = {"search_id": search_id, "topic": topic, "timestamp": timestamp}
+        self._history.append(entry)
+        self._history_count += 1
+        try:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.spill_dir / "history.jsonl", "a") as f:
+                f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        except OSError as e:
+            self.logger.error("Error writing search history: %s", e)
+
+    @property
+    def history_count(self) -> int:
+        return self._history_count
+
+    def history_page(self, page: int, page_size: int = 10) -> List[Dict[str, str]]:
+        """Return one page of history, newest first"""
+        start = page * page_size
+        end = min(start + page_size, self._history_count)
+        if start >= end:
+            return []
+
+        # The newest max_history entries are served from memory
+        if end <= len(self._history):
+            newest_first = list(reversed(self._history))
+            return newest_first[start:end]
+
+        # Older pages fall back to the history file, which is oldest first
+        entries = []
+        try:
+            with open(self.spill_dir / "history.jsonl", "r") as f:
+                for line_number, line in enumerate(f):
+                    position = self._history_count - 1 - line_number
+                    if start <= position < end:
+                        entries.append(json.loads(line))
+        except OSError as e:
+            self.logger.error("Error reading search history: %s", e)
+            return []
+        entries.reverse()
+        return entries
+
+    def clear(self):
+        """Drop everything stored for this session, including spilled files"""
+        self._scripts.clear()
+        self._spilled.clear()
+        self._history.clear()
+        self._history_count = 0
+        shutil.rmtree(self.spill_dir, ignore_errors=True)
@@ -0,0 +1,63 @@
+# services/video_service.py
+
+from typing import Dict, Any, Optional
+from datetime import datetime
+from config.schema import VideoConfig, VideoScript
+from utils.logger import setup_logger
+
+class VideoRenderingService:
+    def __init__(self, tts_backend: Optional[str] = None):
+        self.tts_backend = tts_backend
+        self._renderer = None
+        self.logger = setup_logger("VideoService")
+        self.performance_metrics = {
+            "total_requests": 0,
+            "successful_requests": 0,
+            "failed_requests": 0,
+            "average_render_time": 0,
+            "total_render_time": 0
+        }
+
+    @property
+    def renderer(self):
+        """Build the renderer on first use so moviepy/ffmpeg are imported lazily"""
+        if self._renderer is None:
+            from video import VideoRenderer, get_tts_backend
+            self._renderer = VideoRenderer(tts_backend=get_tts_backend(self.tts_backend))
+        return self._renderer
+
+    def render_video(self, script: VideoScript, config: VideoConfig, output_path: Optional[str] = None) -> str:
+        """Render a narrated video for the script and return its path"""
+        start_time = datetime.now()
+        self.performance_metrics["total_requests"] += 1
+
+        try:
+            self.logger.info("Starting video rendering for topic: %s", config.topic)
+            video_path = self.renderer.render(script, config, output_path)
+
+            render_time = (datetime.now() - start_time).total_seconds()
+            self.performance_metrics["total_render_time"] += render_time
+            self.performance_metrics["successful_requests"] += 1
+            self.performance_metrics["average_render_time"] = (
+                self.performance_metrics["total_render_time"] /
+                self.performance_metrics["successful_requests"]
+            )
+
+            self.logger.info("Video rendered successfully in %.2f seconds", render_time)
+            return video_path
+
+        except Exception as e:
+            self.performance_metrics["failed_requests"] += 1
+            self.logger.error("Error rendering video: %s", e, exc_info=True)
+            raise
+
+    def get_performance_metrics(self) -> Dict[str, Any]:
+        """Get the service's performance metrics"""
+        return {
+            **self.performance_metrics,
+            "success_rate": (
+                self.performance_metrics["successful_requests"] /
+                self.performance_metrics["total_requests"]
+                if self.performance_metrics["total_requests"] > 0 else 0
+            )
+        }
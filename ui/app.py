@@ -5,15 +5,17 @@ import asyncio
 from typing import List
 import uuid
 from datetime import datetime
-from dotenv import load_dotenv
 
 # Add the project root directory to Python path
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
 # from agents import ScriptWriterAgent
-from services.script_service import ScriptGenerationService
+# ScriptGenerationService is imported lazily in get_script_service() since it
+# pulls in crewai/langchain, and Streamlit re-executes this file on every rerun
 from config.schema import VideoConfig, VideoSection
+from services.session_store import SessionStore
+from utils.env import load_env
 from utils.logger import setup_logger
 from utils.config_loader import load_ollama_config
 
@@ -26,8 +28,10 @@ if 'video_path' not in st.session_state:
 # Set up logger
 logger = setup_logger("app")
 
+HISTORY_PAGE_SIZE = 10
+
 # Load environment variables
-load_dotenv()
+load_env()
 
 st.set_page_config(
     page_title="AI Video Creator",
@@ -43,6 +47,15 @@ def display_script_sections(content):
         
     st.subheader("Generated Script")
     
+    # Pipelined generation returns structured sections rather than text
+    if isinstance(content, dict):
+        for section in content.get("sections", []):
+            st.markdown(f"### {section.get('title', '')}")
+            st.markdown(section.get("content", ""))
+            if section.get("transition"):
+                st.markdown(f"*{section['transition']}*")
+        return
+
     st.markdown(content)
     # try:
     #     # Create tabs for each section
@@ -57,6 +70,47 @@ def display_script_sections(content):
     #     st.error(f"Error displaying script sections: {str(e)}")
     #     logger.error(f"Error in display_script_sections: {str(e)}", exc_info=True)
 
+def get_script_service():
+    """Return the session's script service, creating it on first generation"""
+    if st.session_state.get('script_service') is None:
+        from services.script_service import ScriptGenerationService
+        st.session_state.script_service = ScriptGenerationService()
+    return st.session_state.script_service
+
+def get_session_store() -> SessionStore:
+    """Return the session's bounded script and history store"""
+    if st.session_state.get('session_store') is None:
+        st.session_state.session_store = SessionStore()
+    return st.session_state.session_store
+
+def select_search(search_id: str):
+    """Show a previously generated script from the history"""
+    st.session_state.selected_search_id = search_id
+
+def set_history_page(page: int):
+    st.session_state.history_page = page
+
+def display_search_history(store: SessionStore):
+    """Render one page of the search history in the sidebar"""
+    if not store.history_count:
+        return
+    st.markdown("---")
+    st.subheader("Search History")
+
+    page_count = (store.history_count + HISTORY_PAGE_SIZE - 1) // HISTORY_PAGE_SIZE
+    page = min(st.session_state.get('history_page', 0), page_count - 1)
+    for search_data in store.history_page(page, HISTORY_PAGE_SIZE):
+        st.markdown(f"**Topic:** {search_data['topic']}  \n**Time:** {search_data['timestamp']}")
+        if store.has_script(search_data['search_id']):
+            st.button("Open script", key=f"open_{search_data['search_id']}",
+                      on_click=select_search, args=(search_data['search_id'],))
+
+    if page_count > 1:
+        prev_col, page_col, next_col = st.columns(3)
+        prev_col.button("Prev", disabled=page == 0, on_click=set_history_page, args=(page - 1,))
+        page_col.caption(f"Page {page + 1} of {page_count}")
+        next_col.button("Next", disabled=page >= page_count - 1, on_click=set_history_page, args=(page + 1,))
+
 def run_async(coro):
     """Run an async function in a synchronous context"""
     try:
@@ -84,8 +138,7 @@ def main():
     # Initialize session state for search IDs if not exists
     if 'search_id' not in st.session_state:
         st.session_state.search_id = None
-    if 'search_history' not in st.session_state:
-        st.session_state.search_history = {}
+    store = get_session_store()
     
     # Sidebar for configuration
     with st.sidebar:
@@ -99,31 +152,41 @@ def main():
             if st.session_state.search_id is None or topic != st.session_state.get('last_topic'):
                 st.session_state.search_id = str(uuid.uuid4())
                 st.session_state.last_topic = topic
+                st.session_state.selected_search_id = None
                 # Store search in history with timestamp
-                st.session_state.search_history[st.session_state.search_id] = {
-                    'topic': topic,
-                    'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                }
-            logger.info(f"main: User entered topic: {topic} with search_id: {st.session_state.search_id}")
+                store.add_history(
+                    st.session_state.search_id,
+                    topic,
+                    datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                )
+            logger.info("main: User entered topic: %s with search_id: %s", topic, st.session_state.search_id)
         
         # Display search history
-        if st.session_state.search_history:
-            st.markdown("---")
-            st.subheader("Search History")
-            for search_id, search_data in st.session_state.search_history.items():
-                st.markdown(f"**Topic:** {search_data['topic']}  \n**Time:** {search_data['timestamp']}")
+        display_search_history(store)
         
     # Main content area
-    if topic and not st.session_state.is_processing:
+    # Scripts already in the store are shown instead of being regenerated on rerun
+    shown_search_id = st.session_state.get('selected_search_id') or (st.session_state.search_id if topic else None)
+    stored = store.get_script(shown_search_id) if shown_search_id else None
+    if stored is None and st.session_state.get('selected_search_id'):
+        # The selected script's spilled data is gone (e.g. expired); fall back to the current topic
+        st.session_state.selected_search_id = None
+        st.warning("That script is no longer available.")
+        if topic:
+            stored = store.get_script(st.session_state.search_id)
+    if stored is not None:
+        st.header(f"Script about: {stored['config'].topic}")
+        display_script_sections(stored['script'])
+    elif topic and not st.session_state.is_processing:
         st.session_state.is_processing = True
-        logger.info(f"Processing video creation for topic: {topic}")
+        logger.info("Processing video creation for topic: %s", topic)
         st.header(f"Creating video about: {topic}")
         
         # Create config
         config = VideoConfig(topic=topic)
         
         try:
-            logger.info(f"User initiated script generation for search_id: {st.session_state.search_id}")
+            logger.info("User initiated script generation for search_id: %s", st.session_state.search_id)
             
             # Create a placeholder for the status message
             status_placeholder = st.empty()
@@ -136,7 +199,7 @@ def main():
             # Initialize agents
             try:
                 # script_writer = ScriptWriterAgent(config.dict())
-                service = ScriptGenerationService()
+                service = get_script_service()
             except RuntimeError as e:
                 st.error(str(e))
                 st.info("To fix this:\n1. Open a terminal\n2. Run 'ollama serve'\n3. Wait for Ollama to start\n4. Refresh this page")
@@ -151,16 +214,11 @@ def main():
                     script = run_async(service.generate_script(topic))
             except Exception as e:
                 script = None
-                logger.error(f"Unable to get the script. Failed due to {e}")
+                logger.error("Unable to get the script. Failed due to %s", e)
                 raise e
             
-            # Store script in session state with search_id
-            if 'scripts' not in st.session_state:
-                st.session_state.scripts = {}
-            st.session_state.scripts[st.session_state.search_id] = {
-                'script': script,
-                'config': config
-            }
+            # Store script with search_id; old scripts spill to disk
+            store.put_script(st.session_state.search_id, script, config)
 
             # Clear the status and progress placeholders
             status_placeholder.empty()
@@ -185,5 +243,5 @@ if __name__ == "__main__":
         logger.info("Application started")
         main()
     except Exception as e:
-        logger.critical(f"Critical error in application: {str(e)}", exc_info=True)
+        logger.critical("Critical error in application: %s", e, exc_info=True)
         st.error("An unexpected error occurred. Please check the logs for details.") 
\ No newline at end of file
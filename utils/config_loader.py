@@ -1,25 +1,24 @@
 # utils/config_loader.py
 import yaml
 import os
+from functools import lru_cache
 from typing import Dict, Any
 
-def load_ollama_config() -> Dict[str, Any]:
-    """Load Ollama configuration from YAML file"""
+@lru_cache(maxsize=None)
+def _load_crew_config() -> Dict[str, Any]:
+    """Parse the crew YAML file once per process"""
     config_path = os.path.join("config", "crew_config.yaml")
     with open(config_path, "r") as f:
-        config = yaml.safe_load(f)
-    return config.get("ollama", {})
+        return yaml.safe_load(f) or {}
+
+def load_ollama_config() -> Dict[str, Any]:
+    """Load Ollama configuration from YAML file"""
+    return _load_crew_config().get("ollama", {})
 
 def load_agents_config() -> Dict[str, any]:
     """Load Agents configuration from YAML file"""
-    config_path = os.path.join("config", "crew_config.yaml")
-    with open(config_path, "r") as f:
-        config = yaml.safe_load(f)
-    return config.get("agents", {})
+    return _load_crew_config().get("agents", {})
 
 def load_tasks_config() -> Dict[str, any]:
     """Load Agents configuration from YAML file"""
-    config_path = os.path.join("config", "crew_config.yaml")
-    with open(config_path, "r") as f:
-        config = yaml.safe_load(f)
-    return config.get("tasks", {})
\ No newline at end of file
+    return _load_crew_config().get("tasks", {})
@@ -0,0 +1,9 @@
+# utils/env.py
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def load_env() -> bool:
+    """Load environment variables from .env once per process"""
+    from dotenv import load_dotenv
+    return load_dotenv()
@@ -0,0 +1,155 @@
+# utils/json_stream.py
+import json
+from typing import Any, List, NamedTuple, Optional
+
+
+class JSONStreamEvent(NamedTuple):
+    """A value that finished arriving in a streamed JSON object.
+
+    ``index`` is None when the whole value of top-level ``key`` is complete,
+    and the element position when a single entry of a top-level array is.
+    """
+    key: str
+    value: Any
+    index: Optional[int] = None
+
+
+class IncrementalJSONParser:
+    """
+    Parse a JSON object progressively as text chunks arrive.
+
+    Emits an event for each top-level field as soon as its value is complete,
+    and for each element of a top-level array as soon as that element is
+    complete, so consumers can act before the whole object has streamed in.
+    Any text before the first '{' (model preamble) is ignored. Fields that
+    fail to parse are skipped rather than aborting the stream.
+    """
+
+    def __init__(self):
+        self.buffer = ""
+        self.result = {}
+        self.done = False
+        self._pos = 0
+        self._started = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._key_start = None
+        self._key = None
+        self._expect_key = False
+        self._value_start = None
+        self._array_key = None
+        self._element_start = None
+        self._element_index = 0
+
+    def feed(self, chunk: str) -> List[JSONStreamEvent]:
+        """Consume a chunk of text and return the events it completed"""
+        events: List[JSONStreamEvent] = []
+        if self.done:
+            return events
+        self.buffer += chunk
+
+        while self._pos < len(self.buffer):
+            i = self._pos
+            char = self.buffer[i]
+            self._pos += 1
+
+            if not self._started:
+                if char == "{":
+                    self._started = True
+                    self._depth = 1
+                    self._expect_key = True
+                continue
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._key_start is not None:
+                        self._key = self._loads(self.buffer[self._key_start:i + 1])
+                        self._key_start = None
+                continue
+
+            if char.isspace():
+                continue
+
+            if self._depth == 1:
+                if self._expect_key:
+                    if char == '"':
+                        self._in_string = True
+                        self._key_start = i
+                        self._expect_key = False
+                    elif char == "}":
+                        self.done = True
+                        break
+                    continue
+                if char == ":":
+                    self._value_start = self._pos
+                    continue
+                if char in ",}":
+                    self._finish_field(i, events)
+                    if char == "}":
+                        self.done = True
+                        break
+                    self._expect_key = True
+                    continue
+                if char == "[" and self._value_start is not None:
+                    self._array_key = self._key
+                    self._element_start = None
+                    self._element_index = 0
+                self._open_or_close(char)
+                continue
+
+            if self._depth == 2 and self._array_key is not None:
+                if char in ",]":
+                    self._finish_element(i, events)
+                    if char == "]":
+                        self._array_key = None
+                        self._depth = 1
+                    continue
+                if self._element_start is None:
+                    self._element_start = i
+
+            self._open_or_close(char)
+
+        return events
+
+    def _open_or_close(self, char: str):
+        if char == '"':
+            self._in_string = True
+        elif char in "{[":
+            self._depth += 1
+        elif char in "}]":
+            self._depth -= 1
+
+    def _finish_field(self, end: int, events: List[JSONStreamEvent]):
+        if self._key is None or self._value_start is None:
+            return
+        value = self._loads(self.buffer[self._value_start:end])
+        if value is not _INVALID:
+            self.result[self._key] = value
+            events.append(JSONStreamEvent(self._key, value))
+        self._key = None
+        self._value_start = None
+
+    def _finish_element(self, end: int, events: List[JSONStreamEvent]):
+        if self._element_start is None:
+            return
+        value = self._loads(self.buffer[self._element_start:end])
+        if value is not _INVALID:
+            events.append(JSONStreamEvent(self._array_key, value, self._element_index))
+        self._element_index += 1
+        self._element_start = None
+
+    @staticmethod
+    def _loads(text: str) -> Any:
+        try:
+            return json.loads(text)
+        except ValueError:
+            return _INVALID
+
+
+_INVALID = object()
@@ -1,42 +1,179 @@
+import atexit
+import gzip
+import hashlib
 import logging
+import logging.handlers
+import os
+import queue
+import random
+import shutil
 import sys
+import threading
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime
+from typing import NamedTuple, Optional
+from utils.env import load_env
+
+LOG_FORMAT = '%(asctime)s - %(name)s -  %(levelname)s - %(message)s'
+
+
+class PayloadSettings(NamedTuple):
+    """Payload logging knobs, see log_payload()"""
+    max_chars: int
+    sample_rate: float
+    redact: bool
+
+
+@lru_cache(maxsize=None)
+def payload_settings() -> PayloadSettings:
+    """Read the payload logging knobs once, after .env has been loaded"""
+    load_env()
+    return PayloadSettings(
+        max_chars=int(os.getenv("LOG_PAYLOAD_MAX_CHARS", "1000")),
+        sample_rate=float(os.getenv("LOG_PAYLOAD_SAMPLE_RATE", "0.1")),
+        redact=os.getenv("LOG_PAYLOAD_REDACT", "false").lower() in ("1", "true", "yes"),
+    )
+
+_lock = threading.Lock()
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+_sinks = []
+_log_files = set()
+
+
+def _gzip_namer(name: str) -> str:
+    return name + ".gz"
+
+
+def _gzip_rotator(source: str, dest: str):
+    with open(source, "rb") as src, gzip.open(dest, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(source)
+
+
+def _create_file_sink(log_file: str) -> logging.Handler:
+    """Create a size-rotated file handler that gzips rolled-over files"""
+    log_path = Path(log_file)
+    if not log_path.is_absolute() and log_path.parent == Path("."):
+        log_path = Path("logs") / log_path
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_path,
+        maxBytes=int(os.getenv("LOG_FILE_MAX_BYTES", str(10 * 1024 * 1024))),
+        backupCount=int(os.getenv("LOG_FILE_BACKUP_COUNT", "5")),
+        encoding="utf-8",
+        delay=True
+    )
+    file_handler.namer = _gzip_namer
+    file_handler.rotator = _gzip_rotator
+    return file_handler
+
+
+def _stop_listener():
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def configure_logging(log_file: str = None) -> logging.handlers.QueueHandler:
+    """
+    Configure the shared queue-based logging pipeline once per process.
+
+    Loggers only enqueue records; a background QueueListener writes them to
+    stdout and, if requested via ``log_file`` or the LOG_FILE env var, to a
+    rotating gzip-compressed file. Repeated calls are no-ops unless they add
+    a new file sink.
+    """
+    global _queue_handler, _listener
+
+    # LOG_* settings may come from .env, which nothing else has loaded yet
+    # when the first logger is created at import time
+    load_env()
+    log_file = log_file or os.getenv("LOG_FILE")
+    with _lock:
+        if _queue_handler is not None and (not log_file or log_file in _log_files):
+            return _queue_handler
+
+        if _queue_handler is None:
+            formatter = logging.Formatter(LOG_FORMAT)
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_handler.setFormatter(formatter)
+            _sinks.append(console_handler)
+            _queue_handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+            atexit.register(_stop_listener)
+
+        if log_file and log_file not in _log_files:
+            file_handler = _create_file_sink(log_file)
+            file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+            _sinks.append(file_handler)
+            _log_files.add(log_file)
+
+        # QueueListener's handlers are fixed at construction, so restart it
+        # whenever the set of sinks changes
+        _stop_listener()
+        _listener = logging.handlers.QueueListener(
+            _queue_handler.queue, *_sinks, respect_handler_level=True
+        )
+        _listener.start()
+        return _queue_handler
+
 
 def setup_logger(name: str, log_file: str = None) -> logging.Logger:
     """
-    Set up a logger with both file and console handlers
+    Get a logger wired to the shared non-blocking logging pipeline.
+
+    Safe to call repeatedly for the same name; the queue handler is attached
+    only once so records are never duplicated.
     """
-    # Create logs directory if it doesn't exist
-    log_dir = Path("logs")
-    log_dir.mkdir(exist_ok=True)
+    queue_handler = configure_logging(log_file)
 
-    # Create logger
     logger = logging.getLogger(name)
-    logger.setLevel(logging.DEBUG)
-
-    # # Create formatters
-    # file_formatter = logging.Formatter(
-    #     '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    # )
-    console_formatter = logging.Formatter(
-        '%(asctime)s - %(name)s -  %(levelname)s - %(message)s'
-    )
+    logger.setLevel(os.getenv("LOG_LEVEL", "DEBUG").upper())
+    if queue_handler not in logger.handlers:
+        logger.addHandler(queue_handler)
 
-    # Create and configure file handler
-    # if log_file is None:
-    #     log_file = f"{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-    # file_handler = logging.FileHandler(log_dir / log_file)
-    # file_handler.setLevel(logging.DEBUG)
-    # file_handler.setFormatter(file_formatter)
+    return logger
 
-    # Create and configure console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.DEBUG)
-    console_handler.setFormatter(console_formatter)
 
-    # Add handlers to logger
-    # logger.addHandler(file_handler) 
-    logger.addHandler(console_handler)
+def sample_payload(sample_rate: float = None) -> bool:
+    """
+    Decide once whether a call's payloads are logged.
+
+    Pass the result to every log_payload() call for that request so a
+    sampled prompt is always logged together with its response.
+    """
+    sample_rate = payload_settings().sample_rate if sample_rate is None else sample_rate
+    return sample_rate >= 1.0 or random.random() < sample_rate
+
+
+def log_payload(logger: logging.Logger, label: str, payload: str,
+                level: int = logging.DEBUG, max_chars: int = None, sampled: bool = None):
+    """
+    Log a large prompt/response payload with sampling and a size cap.
+
+    Nothing is formatted unless the level is enabled and the record is
+    sampled; ``sampled`` comes from sample_payload() and is drawn here when
+    omitted. With LOG_PAYLOAD_REDACT set, only the length and a digest of
+    the payload are logged.
+    """
+    if not logger.isEnabledFor(level):
+        return
+    if sampled is None:
+        sampled = sample_payload()
+    if not sampled:
+        return
+
+    settings = payload_settings()
+    payload = payload or ""
+    if settings.redact:
+        digest = hashlib.sha1(payload.encode("utf-8", "replace")).hexdigest()[:12]
+        logger.log(level, "%s (%d chars, sha1 %s): <redacted>", label, len(payload), digest)
+        return
 
-    return logger 
\ No newline at end of file
+    max_chars = settings.max_chars if max_chars is None else max_chars
+    if len(payload) > max_chars:
+        logger.log(level, "%s (%d chars, truncated): %s...", label, len(payload), payload[:max_chars])
+    else:
+        logger.log(level, "%s (%d chars): %s", label, len(payload), payload)
@@ -0,0 +1,3 @@
+from .cache import RenderCache, content_hash
+from .tts import TTSBackend, GTTSBackend, Pyttsx3Backend, get_tts_backend
+from .renderer import VideoRenderer
@@ -0,0 +1,38 @@
+# video/cache.py
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Optional
+
+
+def content_hash(*parts: Any) -> str:
+    """Stable sha256 over JSON-serialisable parts, used as a cache key"""
+    payload = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class RenderCache:
+    """Content-addressed store for narration audio and rendered clips"""
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = Path(root or os.getenv("RENDER_CACHE_DIR", "cache/render"))
+
+    def path_for(self, kind: str, key: str, ext: str) -> Path:
+        """Return where an artifact lives, creating its directory if needed"""
+        directory = self.root / kind / key[:2]
+        directory.mkdir(parents=True, exist_ok=True)
+        return directory / f"{key}.{ext}"
+
+    def get(self, kind: str, key: str, ext: str) -> Optional[Path]:
+        """Return the cached artifact path if it exists and is non-empty"""
+        path = self.path_for(kind, key, ext)
+        if path.exists() and path.stat().st_size > 0:
+            return path
+        return None
+
+    @staticmethod
+    def commit(tmp_path: Path, path: Path) -> Path:
+        """Atomically move a freshly written artifact into the cache"""
+        os.replace(tmp_path, path)
+        return path
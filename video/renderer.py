@@ -0,0 +1,222 @@
+# video/renderer.py
+import multiprocessing
+import os
+import tempfile
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from config.schema import VideoConfig, VideoScript, VideoSection
+from utils.logger import setup_logger
+from .cache import RenderCache, content_hash
+from .tts import TTSBackend, get_tts_backend
+
+RESOLUTION = (1280, 720)
+FPS = 24
+BACKGROUND_COLOR = (0, 0, 0)
+BACKGROUND_MUSIC_VOLUME = 0.15
+
+# Every section clip is encoded with identical parameters so the final
+# concat can stream-copy instead of re-encoding
+CLIP_ENCODING = {
+    "fps": FPS,
+    "codec": "libx264",
+    "audio_codec": "aac",
+    "audio_fps": 44100,
+    "preset": "veryfast",
+    "ffmpeg_params": ["-pix_fmt", "yuv420p"],
+}
+
+
+def _render_section_clip(job: Dict) -> str:
+    """Render one section clip; runs in a worker process"""
+    import numpy as np
+    from moviepy.editor import AudioClip, AudioFileClip, ColorClip, CompositeAudioClip, ImageClip
+    from PIL import Image
+
+    if job["audio_path"]:
+        narration = AudioFileClip(job["audio_path"])
+        duration = max(narration.duration, job["duration"] or 0)
+        # CompositeAudioClip pads with silence when the section outlasts its narration
+        audio = CompositeAudioClip([narration]).set_duration(duration)
+    else:
+        # Sections without narration still need an audio stream so the
+        # concat can stream-copy
+        narration = None
+        duration = job["duration"]
+        audio = AudioClip(
+            lambda t: np.zeros((len(t), 2)) if isinstance(t, np.ndarray) else [0, 0],
+            duration=duration,
+            fps=CLIP_ENCODING["audio_fps"]
+        )
+
+    image = next((visual for visual in job["visuals"] if os.path.isfile(visual)), None)
+    if image:
+        # moviepy 1.0.3's resize relies on Image.ANTIALIAS, removed in Pillow 10
+        with Image.open(image) as frame:
+            clip = ImageClip(np.array(frame.convert("RGB").resize(RESOLUTION, Image.LANCZOS)))
+    else:
+        clip = ColorClip(size=RESOLUTION, color=BACKGROUND_COLOR)
+    clip = clip.set_duration(duration).set_audio(audio)
+
+    output_path = Path(job["output_path"])
+    tmp_path = output_path.with_name(f"{output_path.stem}.{uuid.uuid4().hex}.tmp.mp4")
+    try:
+        clip.write_videofile(
+            str(tmp_path),
+            threads=job["threads"],
+            verbose=False,
+            logger=None,
+            **CLIP_ENCODING
+        )
+        RenderCache.commit(tmp_path, output_path)
+    finally:
+        clip.close()
+        if narration is not None:
+            narration.close()
+        if tmp_path.exists():
+            tmp_path.unlink()
+    return str(output_path)
+
+
+class VideoRenderer:
+    """
+    Turn a VideoScript into a narrated video.
+
+    Narration is synthesized per section, section clips are rendered in a
+    process pool, and both are cached by content hash so unchanged sections
+    are never redone. The final video is stitched with one ffmpeg concat pass.
+    """
+
+    def __init__(self, tts_backend: Optional[TTSBackend] = None, cache: Optional[RenderCache] = None,
+                 max_workers: Optional[int] = None, output_dir: str = "output/videos"):
+        self.tts_backend = tts_backend or get_tts_backend()
+        self.cache = cache or RenderCache()
+        self.max_workers = max_workers or int(os.getenv("RENDER_WORKERS", str(os.cpu_count() or 1)))
+        self.output_dir = Path(output_dir)
+        self.logger = setup_logger("VideoRenderer")
+
+    def render(self, script: VideoScript, config: VideoConfig, output_path: Optional[str] = None) -> str:
+        """Render the script and return the path of the final video"""
+        if not script.sections:
+            raise ValueError("Script has no sections to render")
+
+        audio_paths = self._synthesize_narration(script.sections, config)
+        clip_paths = self._render_clips(script.sections, audio_paths)
+
+        if output_path is None:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            video_key = content_hash("video", [str(path) for path in clip_paths], config.background_music)
+            output_path = str(self.output_dir / f"{video_key}.mp4")
+            if os.path.exists(output_path):
+                self.logger.info("Reusing rendered video %s", output_path)
+                return output_path
+
+        self._concat(clip_paths, output_path, config.background_music)
+        self.logger.info("Rendered %d sections to %s", len(clip_paths), output_path)
+        return output_path
+
+    def _synthesize_narration(self, sections: List[VideoSection], config: VideoConfig) -> List[Optional[Path]]:
+        """Synthesize narration for every section, reusing cached audio
+
+        Sections without text get None; sections sharing the same text are
+        synthesized once.
+        """
+        backend = self.tts_backend
+        keys: List[Optional[str]] = []
+        texts: Dict[str, str] = {}
+        for section in sections:
+            text = (section.content or "").strip()
+            if not text:
+                keys.append(None)
+                continue
+            key = content_hash("narration", backend.name, text, config.language, config.voice_speed)
+            keys.append(key)
+            texts.setdefault(key, text)
+
+        def synthesize(key: str) -> Path:
+            cached = self.cache.get("audio", key, backend.extension)
+            if cached:
+                return cached
+            path = self.cache.path_for("audio", key, backend.extension)
+            tmp_path = path.with_name(f"{key}.{uuid.uuid4().hex}.tmp.{backend.extension}")
+            backend.synthesize(texts[key], str(tmp_path), language=config.language, speed=config.voice_speed)
+            return RenderCache.commit(tmp_path, path)
+
+        if not texts:
+            paths = {}
+        elif not backend.thread_safe:
+            paths = {key: synthesize(key) for key in texts}
+        else:
+            with ThreadPoolExecutor(max_workers=min(len(texts), 8)) as executor:
+                paths = dict(zip(texts, executor.map(synthesize, texts)))
+        return [paths[key] if key else None for key in keys]
+
+    def _render_clips(self, sections: List[VideoSection], audio_paths: List[Optional[Path]]) -> List[Path]:
+        """Render section clips in a process pool, skipping ones already cached"""
+        clip_paths: List[Path] = []
+        jobs: Dict[str, Dict] = {}
+        for section, audio_path in zip(sections, audio_paths):
+            if audio_path is None and not section.duration:
+                self.logger.warning("Skipping section '%s' with no narration or duration", section.title)
+                continue
+            visuals = section.visuals or []
+            key = content_hash(
+                "clip",
+                audio_path.stem if audio_path else None,
+                [(visual, os.path.getmtime(visual) if os.path.isfile(visual) else None) for visual in visuals],
+                section.duration,
+                RESOLUTION,
+                CLIP_ENCODING
+            )
+            cached = self.cache.get("clips", key, "mp4")
+            path = cached or self.cache.path_for("clips", key, "mp4")
+            clip_paths.append(path)
+            if not cached and key not in jobs:
+                jobs[key] = {
+                    "audio_path": str(audio_path) if audio_path else None,
+                    "visuals": visuals,
+                    "duration": section.duration,
+                    "output_path": str(path),
+                }
+
+        if not clip_paths:
+            raise ValueError("Script has no sections with narration or a duration to render")
+        self.logger.info("Rendering %d of %d section clips", len(jobs), len(clip_paths))
+        if jobs:
+            workers = min(self.max_workers, len(jobs))
+            threads = max(1, (os.cpu_count() or 1) // workers)
+            for job in jobs.values():
+                job["threads"] = threads
+            # Spawn rather than fork: forking a threaded process (Streamlit,
+            # the logging QueueListener) can deadlock the children
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+                # list() surfaces the first worker exception here
+                list(executor.map(_render_section_clip, jobs.values()))
+        return clip_paths
+
+    def _concat(self, clip_paths: List[Path], output_path: str, background_music: Optional[str] = None):
+        """Stitch clips with the concat demuxer, copying the video stream"""
+        import ffmpeg
+
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as list_file:
+            for path in clip_paths:
+                escaped = str(Path(path).resolve()).replace("'", "'\\''")
+                list_file.write(f"file '{escaped}'\n")
+
+        try:
+            stream = ffmpeg.input(list_file.name, format="concat", safe=0)
+            if background_music:
+                music = ffmpeg.input(background_music, stream_loop=-1).audio.filter("volume", BACKGROUND_MUSIC_VOLUME)
+                audio = ffmpeg.filter([stream.audio, music], "amix", inputs=2, duration="first")
+                output = ffmpeg.output(stream.video, audio, output_path, vcodec="copy", acodec="aac")
+            else:
+                output = ffmpeg.output(stream, output_path, c="copy")
+            output.overwrite_output().run(quiet=True)
+        except ffmpeg.Error as e:
+            self.logger.error("ffmpeg concat failed: %s", e.stderr.decode("utf-8", "replace") if e.stderr else e)
+            raise
+        finally:
+            os.remove(list_file.name)
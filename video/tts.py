@@ -0,0 +1,70 @@
+# video/tts.py
+import os
+from abc import ABC, abstractmethod
+from typing import Dict, Type
+
+
+class TTSBackend(ABC):
+    """Interface for narration engines"""
+
+    name: str = ""
+    # Whether synthesize() may be called from several threads at once
+    thread_safe: bool = True
+    # File extension of the audio produced
+    extension: str = "mp3"
+
+    @abstractmethod
+    def synthesize(self, text: str, output_path: str, language: str = "en", speed: float = 1.0):
+        """Write narration for text to output_path"""
+
+
+class GTTSBackend(TTSBackend):
+    """Google Translate TTS via gTTS (needs network access)"""
+
+    name = "gtts"
+
+    def synthesize(self, text: str, output_path: str, language: str = "en", speed: float = 1.0):
+        from gtts import gTTS
+
+        # gTTS only offers a normal and a slow voice
+        gTTS(text=text, lang=language, slow=speed < 1.0).save(output_path)
+
+
+class Pyttsx3Backend(TTSBackend):
+    """Offline TTS using the local system engine (espeak, SAPI5, NSSpeechSynthesizer)"""
+
+    name = "pyttsx3"
+    thread_safe = False
+    extension = "wav"
+
+    def __init__(self):
+        self._engine = None
+        self._base_rate = None
+
+    def synthesize(self, text: str, output_path: str, language: str = "en", speed: float = 1.0):
+        if self._engine is None:
+            try:
+                import pyttsx3
+            except ImportError as e:
+                raise RuntimeError("The offline TTS backend requires pyttsx3: pip install pyttsx3") from e
+            self._engine = pyttsx3.init()
+            self._base_rate = self._engine.getProperty("rate")
+
+        self._engine.setProperty("rate", int(self._base_rate * speed))
+        self._engine.save_to_file(text, output_path)
+        self._engine.runAndWait()
+
+
+TTS_BACKENDS: Dict[str, Type[TTSBackend]] = {
+    GTTSBackend.name: GTTSBackend,
+    Pyttsx3Backend.name: Pyttsx3Backend,
+    "local": Pyttsx3Backend,
+}
+
+
+def get_tts_backend(name: str = None) -> TTSBackend:
+    """Instantiate a TTS backend by name, defaulting to the TTS_BACKEND env var"""
+    name = (name or os.getenv("TTS_BACKEND", GTTSBackend.name)).lower()
+    if name not in TTS_BACKENDS:
+        raise ValueError(f"Unknown TTS backend '{name}'. Available: {', '.join(sorted(TTS_BACKENDS))}")
+    return TTS_BACKENDS[name]()